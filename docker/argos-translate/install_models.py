@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Download and install Argos Translate language packages
+
+Installs the th→en and en→th packages concurrently so setup takes one
+download's worth of wall time instead of two — each download+install is
+an independent network+disk operation.
+
+Author: Q-Collector Team
+"""
+
+import concurrent.futures
+import sys
+
+import argostranslate.package
+
+LANGUAGE_PAIRS = [("th", "en"), ("en", "th")]
+
+
+def download_and_install(pkg):
+    """Download one package and install it from the downloaded path"""
+    print(f"Downloading {pkg.package_name}...")
+    path = pkg.download()
+    print(f"Installing from {path}...")
+    argostranslate.package.install_from_path(path)
+    print(f"✅ {pkg.from_code}→{pkg.to_code} installed")
+
+
+def main():
+    argostranslate.package.update_package_index()
+    available = argostranslate.package.get_available_packages()
+
+    packages = []
+    for from_code, to_code in LANGUAGE_PAIRS:
+        pkg = next(
+            (p for p in available if p.from_code == from_code and p.to_code == to_code),
+            None
+        )
+        if pkg:
+            packages.append(pkg)
+        else:
+            print(f"⚠️ No package available for {from_code}→{to_code}")
+
+    if not any(p.from_code == "th" and p.to_code == "en" for p in packages):
+        print("❌ Thai→English model not found")
+        sys.exit(1)
+
+    # Overlap the downloads instead of installing sequentially
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(download_and_install, pkg) for pkg in packages]
+        concurrent.futures.wait(futures)
+        for future in futures:
+            future.result()
+
+    print("✅ All language packages installed")
+
+
+if __name__ == "__main__":
+    main()
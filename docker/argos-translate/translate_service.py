@@ -3,30 +3,105 @@
 Argos Translate FastAPI Service
 Provides HTTP API for Thai→English translation
 
+Uses CTranslate2 with int8 quantization as the primary backend
+(2-4x faster than the default FP32 path on CPU), with Argos Translate
+kept as a fallback when CTranslate2 is unavailable.
+
 Author: Q-Collector Team
-Version: 1.0.0
+Version: 1.1.0
 """
 
-from fastapi import FastAPI, HTTPException
+import os
+
+# Per-worker thread budget: Gunicorn runs several workers on the same
+# host (TRANSLATE_WORKERS is exported by gunicorn_config.py), so each
+# worker gets its share of the cores rather than all of them — otherwise
+# N workers x cpu_count threads oversubscribe the CPU and latency
+# regresses. Standalone runs keep the full core count.
+_WORKER_COUNT = max(1, int(os.environ.get("TRANSLATE_WORKERS", "1")))
+THREADS_PER_WORKER = max(1, (os.cpu_count() or 1) // _WORKER_COUNT)
+
+# Pin BLAS/OpenMP thread pools before ctranslate2/numpy initialize —
+# setting these after the libraries are imported has no effect
+os.environ.setdefault("OMP_NUM_THREADS", str(THREADS_PER_WORKER))
+os.environ.setdefault("MKL_NUM_THREADS", str(THREADS_PER_WORKER))
+
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from typing import Optional, List
 import argostranslate.translate
 import argostranslate.package
+import asyncio
+import concurrent.futures
+import glob
 import logging
+import logging.handlers
+import multiprocessing
+import queue
+import re
+import threading
 import time
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from collections import OrderedDict
+
+try:
+    import ctranslate2
+    import sentencepiece
+    CTRANSLATE2_AVAILABLE = True
+except ImportError:
+    CTRANSLATE2_AVAILABLE = False
+
+try:
+    from pythainlp.tokenize import sent_tokenize as thai_sent_tokenize
+    PYTHAINLP_AVAILABLE = True
+except ImportError:
+    PYTHAINLP_AVAILABLE = False
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+# Configure logging: request threads only enqueue records; a dedicated
+# listener thread drains them to stderr, so handlers never block on the
+# global log I/O lock under high QPS. The QueueHandler stays formatter-
+# free (pass-through) — the final line is formatted once by the
+# listener's StreamHandler.
+_log_queue = queue.Queue(-1)
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO)
+_root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = None
 logger = logging.getLogger(__name__)
 
+
+def _start_log_listener():
+    """
+    Start the per-process QueueListener draining the log queue to stderr.
+
+    Must run after fork: under Gunicorn with preload_app the module is
+    imported in the master and workers are forked afterward, and threads
+    don't survive fork() — a listener started at import time would leave
+    every worker's records piling up in the queue with nothing draining
+    them.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    )
+    _log_listener = logging.handlers.QueueListener(_log_queue, stream_handler)
+    _log_listener.start()
+
 app = FastAPI(
     title="Argos Translate Service",
     description="Thai-English translation service for Q-Collector",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -41,17 +116,329 @@ app.add_middleware(
 # Global variables
 installed_languages = None
 th_en_translation = None
+LANG_BY_CODE = {}          # language code -> Language object, built once
+TRANSLATIONS = {}          # (source, target) -> Translation object, built once
+LANGUAGE_CODES = []        # installed language codes, built once for /health
+ct2_translator = None      # CTranslate2 Translator (primary backend)
+ct2_backend = None         # "cpu/int8" or "cuda/float16" when CT2 is loaded
+sp_processor = None        # SentencePiece tokenizer for the CT2 backend
+translate_queue = None     # asyncio.Queue of (text, Future) for micro-batching
+TRANSLATE_POOL = None      # ThreadPoolExecutor for CPU-bound model calls
+
+# Micro-batching: coalesce concurrent /translate requests arriving within
+# a short window into one batched decode
+MAX_BATCH = 16
+MAX_WAIT_MS = 10
+
+# LRU translation cache keyed by (from_lang, to_lang, text). Form labels
+# like "ชื่อเต็ม" and "เบอร์โทรศัพท์" repeat constantly, and a cache hit
+# skips the entire encoder+decoder pass. An explicit OrderedDict is used
+# instead of functools.lru_cache so the batched miss path can populate it.
+TRANSLATION_CACHE_SIZE = 10000
+_translation_cache = OrderedDict()
+_translation_cache_lock = threading.Lock()
+
+
+def _cache_get(from_lang, to_lang, text):
+    """Look up a cached translation, refreshing its LRU position on hit"""
+    key = (from_lang, to_lang, text)
+    with _translation_cache_lock:
+        translated = _translation_cache.get(key)
+        if translated is not None:
+            _translation_cache.move_to_end(key)
+        return translated
+
+
+def _cache_put(from_lang, to_lang, text, translated):
+    """Store a translation, evicting least-recently-used entries if full"""
+    key = (from_lang, to_lang, text)
+    with _translation_cache_lock:
+        _translation_cache[key] = translated
+        _translation_cache.move_to_end(key)
+        while len(_translation_cache) > TRANSLATION_CACHE_SIZE:
+            _translation_cache.popitem(last=False)
+# Plain counters only — no derived values on the hot path; average_time_ms
+# is computed on read in _stats_snapshot(). The counters live in shared
+# memory (created at import, before Gunicorn's preload_app fork) so every
+# worker updates the same totals and /stats on any worker reports the
+# aggregate view instead of one process's slice.
 translation_stats = {
-    "total_requests": 0,
-    "total_characters": 0,
-    "average_time_ms": 0,
-    "errors": 0
+    "total_requests": multiprocessing.Value('Q', 0),
+    "total_characters": multiprocessing.Value('Q', 0),
+    "total_time_ms_sum": multiprocessing.Value('d', 0.0),
+    "cache_hits": multiprocessing.Value('Q', 0),
+    "errors": multiprocessing.Value('Q', 0)
 }
 
+
+def _record_stats(requests=0, characters=0, time_ms=0.0, cache_hits=0, errors=0):
+    """Atomically bump the shared translation counters"""
+    deltas = {
+        "total_requests": requests,
+        "total_characters": characters,
+        "total_time_ms_sum": time_ms,
+        "cache_hits": cache_hits,
+        "errors": errors
+    }
+    for name, delta in deltas.items():
+        if delta:
+            counter = translation_stats[name]
+            with counter.get_lock():
+                counter.value += delta
+
+
+def _stats_snapshot():
+    """Read the shared counters and derive average_time_ms for reporting"""
+    snapshot = {name: counter.value for name, counter in translation_stats.items()}
+    total = snapshot["total_requests"]
+    snapshot["total_time_ms_sum"] = round(snapshot["total_time_ms_sum"], 2)
+    snapshot["average_time_ms"] = round(snapshot["total_time_ms_sum"] / total, 2) if total else 0
+    return snapshot
+
+def _find_argos_package_dir(from_code="th", to_code="en"):
+    """Locate the installed Argos package directory for a language pair"""
+    packages_root = os.path.expanduser("~/.local/share/argos-translate/packages")
+    pattern = os.path.join(packages_root, f"*{from_code}_{to_code}*")
+    matches = sorted(glob.glob(pattern))
+    return matches[0] if matches else None
+
+
+def _load_ctranslate2_model():
+    """
+    Load the Argos package's OpenNMT model through CTranslate2 with int8
+    quantization. The .argosmodel package already ships a CTranslate2 model
+    directory, so no offline conversion step is needed — int8 quantization
+    happens at load time via compute_type.
+    """
+    global ct2_translator, ct2_backend, sp_processor
+
+    if not CTRANSLATE2_AVAILABLE:
+        logger.warning("⚠️ CTranslate2 not available, using Argos backend")
+        return
+
+    package_dir = _find_argos_package_dir("th", "en")
+    if not package_dir:
+        logger.warning("⚠️ Argos th→en package directory not found, using Argos backend")
+        return
+
+    model_path = os.path.join(package_dir, "model")
+    sp_model_path = os.path.join(package_dir, "sentencepiece.model")
+
+    if not os.path.isdir(model_path) or not os.path.isfile(sp_model_path):
+        logger.warning(f"⚠️ CTranslate2 model files missing in {package_dir}, using Argos backend")
+        return
+
+    try:
+        # Respect ARGOS_DEVICE_TYPE from docker-compose; auto-detect otherwise
+        device_pref = os.environ.get("ARGOS_DEVICE_TYPE", "auto").lower()
+        use_cuda = device_pref != "cpu" and ctranslate2.get_cuda_device_count() > 0
+
+        if use_cuda:
+            # float16 on GPU — tensor-core matmul throughput dwarfs CPU int8
+            ct2_translator = ctranslate2.Translator(
+                model_path,
+                device="cuda",
+                compute_type="float16"
+            )
+            ct2_backend = "cuda/float16"
+        else:
+            ct2_translator = ctranslate2.Translator(
+                model_path,
+                device="cpu",
+                compute_type="int8",
+                inter_threads=1,
+                intra_threads=THREADS_PER_WORKER
+            )
+            ct2_backend = "cpu/int8"
+
+        sp_processor = sentencepiece.SentencePieceProcessor(model_file=sp_model_path)
+        logger.info(f"✅ CTranslate2 backend loaded ({ct2_backend}) from {model_path}")
+    except Exception as e:
+        ct2_translator = None
+        ct2_backend = None
+        sp_processor = None
+        logger.warning(f"⚠️ CTranslate2 load failed ({str(e)}), using Argos backend")
+
+
+def _encode(text):
+    """
+    SentencePiece-tokenize text into subword pieces.
+
+    Uses the processor loaded once at startup, so the per-call tokenizer
+    setup Argos pays on every translate() is avoided; token lists are fed
+    straight into translate_batch.
+    """
+    return sp_processor.encode(text, out_type=str)
+
+
+def _model_translate(text):
+    """Translate a single string via CTranslate2 (int8), falling back to Argos"""
+    if ct2_translator and sp_processor:
+        tokens = _encode(text)
+        results = ct2_translator.translate_batch(
+            [tokens],
+            beam_size=1,
+            max_decoding_length=256
+        )
+        return sp_processor.decode(results[0].hypotheses[0])
+    return th_en_translation.translate(text)
+
+
+def _model_translate_batch(texts):
+    """
+    Translate a list of strings in one batched decode.
+
+    Empty/whitespace-only entries are preserved as "" at their original
+    positions. Inputs are sorted by token length (descending) before
+    batching so padding waste inside each batch is minimized.
+    """
+    results = [""] * len(texts)
+    indexed = [(i, t) for i, t in enumerate(texts) if t and t.strip()]
+    if not indexed:
+        return results
+
+    # Serve exact repeats from the LRU cache; only misses hit the model
+    misses = []
+    for i, t in indexed:
+        cached = _cache_get("th", "en", t)
+        if cached is not None:
+            results[i] = cached
+            _record_stats(cache_hits=1)
+        else:
+            misses.append((i, t))
+
+    if not misses:
+        return results
+
+    # Repeated labels inside one batch only get decoded once — translate
+    # the unique strings and scatter the results to every occurrence
+    unique_texts = list(dict.fromkeys(t for _, t in misses))
+
+    if ct2_translator and sp_processor:
+        tokenized = [(t, _encode(t)) for t in unique_texts]
+        tokenized.sort(key=lambda item: len(item[1]), reverse=True)
+        batch_results = ct2_translator.translate_batch(
+            [tokens for _, tokens in tokenized],
+            beam_size=1,
+            max_batch_size=32,
+            max_decoding_length=256
+        )
+        table = {
+            t: sp_processor.decode(result.hypotheses[0])
+            for (t, _), result in zip(tokenized, batch_results)
+        }
+    else:
+        # Argos fallback has no batched API — translate one by one
+        table = {t: th_en_translation.translate(t) for t in unique_texts}
+
+    for t, translated in table.items():
+        _cache_put("th", "en", t, translated)
+    for i, t in misses:
+        results[i] = table[t]
+
+    return results
+
+
+async def _batch_worker():
+    """
+    Background coroutine that drains the translate queue.
+
+    Collects up to MAX_BATCH pending requests (waiting at most MAX_WAIT_MS
+    for stragglers) and runs them as one batched decode, so N tiny GEMMs
+    from concurrent callers become one larger, compute-bound GEMM.
+    """
+    loop = asyncio.get_running_loop()
+
+    while True:
+        text, future = await translate_queue.get()
+        batch = [(text, future)]
+
+        deadline = loop.time() + MAX_WAIT_MS / 1000
+        while len(batch) < MAX_BATCH:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(translate_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        try:
+            # Run the CPU-bound decode off the event loop — CTranslate2
+            # releases the GIL in C++, so other coroutines keep running
+            results = await loop.run_in_executor(
+                TRANSLATE_POOL, _model_translate_batch, [t for t, _ in batch]
+            )
+            for (_, fut), result in zip(batch, results):
+                if not fut.done():
+                    fut.set_result(result)
+        except Exception as e:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+
+
+# Fallback splitter when PyThaiNLP is unavailable (Thai rarely uses
+# terminal punctuation, so PyThaiNLP's sent_tokenize is preferred)
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+def _split_sentences(text):
+    """Split a text blob on sentence boundaries for per-sentence caching"""
+    global PYTHAINLP_AVAILABLE
+
+    if PYTHAINLP_AVAILABLE:
+        # The import check above only proves sent_tokenize is importable —
+        # its default crfcut engine imports pycrfsuite at call time, so a
+        # missing engine dependency would otherwise 500 every /translate
+        try:
+            sentences = [s.strip() for s in thai_sent_tokenize(text) if s.strip()]
+            return sentences if sentences else [text]
+        except Exception as e:
+            PYTHAINLP_AVAILABLE = False
+            logger.warning(f"⚠️ PyThaiNLP sent_tokenize failed ({str(e)}), using regex splitter")
+
+    sentences = [s.strip() for s in _SENTENCE_SPLIT_RE.split(text) if s.strip()]
+    return sentences if sentences else [text]
+
+
+async def _translate_text(text):
+    """
+    Translate a text blob sentence-by-sentence through the LRU cache.
+
+    A multi-sentence description that shares sentences with earlier inputs
+    only pays for its unseen sentences; the uncached ones are submitted
+    together so the micro-batching worker coalesces them into one batched
+    decode.
+    """
+    sentences = _split_sentences(text)
+    if len(sentences) == 1:
+        return await _translate_queued(text)
+
+    translated = await asyncio.gather(*(_translate_queued(s) for s in sentences))
+    return " ".join(translated)
+
+
+async def _translate_queued(text):
+    """Submit a single text to the micro-batching queue and await its result"""
+    # Cache hits skip the queue entirely — no reason to wait for a batch
+    cached = _cache_get("th", "en", text)
+    if cached is not None:
+        _record_stats(cache_hits=1)
+        return cached
+
+    future = asyncio.get_running_loop().create_future()
+    await translate_queue.put((text, future))
+    return await future
+
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize translation models on startup"""
-    global installed_languages, th_en_translation
+    global installed_languages, th_en_translation, translate_queue, TRANSLATE_POOL
+
+    # Runs once per worker process, after any fork
+    _start_log_listener()
 
     logger.info("🚀 Starting Argos Translate Service...")
 
@@ -60,23 +447,56 @@ async def startup_event():
         installed_languages = argostranslate.translate.get_installed_languages()
         logger.info(f"📚 Found {len(installed_languages)} installed languages")
 
-        # Get Thai→English translation
-        th_lang = next((l for l in installed_languages if l.code == 'th'), None)
-        en_lang = next((l for l in installed_languages if l.code == 'en'), None)
-
-        if th_lang and en_lang:
-            th_en_translation = th_lang.get_translation(en_lang)
+        # Resolve language and translation objects once — everything after
+        # startup is an O(1) dict lookup, never a scan over installed packages
+        LANG_BY_CODE.update({lang.code: lang for lang in installed_languages})
+        LANGUAGE_CODES.extend(LANG_BY_CODE.keys())
+        for source_code, target_code in [("th", "en"), ("en", "th")]:
+            source_lang = LANG_BY_CODE.get(source_code)
+            target_lang = LANG_BY_CODE.get(target_code)
+            if source_lang and target_lang:
+                TRANSLATIONS[(source_code, target_code)] = source_lang.get_translation(target_lang)
+
+        th_en_translation = TRANSLATIONS.get(("th", "en"))
+        if th_en_translation:
             logger.info("✅ Thai→English translation model loaded successfully")
-
-            # Test translation
-            test_text = "สวัสดี"
-            test_result = th_en_translation.translate(test_text)
-            logger.info(f"🧪 Test translation: '{test_text}' → '{test_result}'")
         else:
-            error_msg = f"❌ Translation model not available. th_lang={th_lang}, en_lang={en_lang}"
+            error_msg = f"❌ Translation model not available. installed={list(LANG_BY_CODE.keys())}"
             logger.error(error_msg)
             raise RuntimeError(error_msg)
 
+        # Load the quantized CTranslate2 backend (Argos stays as fallback)
+        _load_ctranslate2_model()
+
+        # Test translation
+        test_text = "สวัสดี"
+        test_result = _model_translate(test_text)
+        logger.info(f"🧪 Test translation: '{test_text}' → '{test_result}'")
+
+        # Warm the decoder with a realistic batch shape so the first real
+        # request doesn't pay BLAS spinup / lazy-init costs
+        if ct2_translator and sp_processor:
+            ctranslate2.set_random_seed(0)
+            warmup_tokens = _encode("แบบฟอร์มบันทึกข้อมูลสำหรับทดสอบระบบ")
+            ct2_translator.translate_batch(
+                [warmup_tokens] * MAX_BATCH,
+                beam_size=1,
+                max_decoding_length=256
+            )
+            logger.info(f"🔥 Warmup batch complete (batch={MAX_BATCH})")
+
+        # Bounded pool for CPU-bound model calls so the event loop never
+        # blocks on a decode
+        TRANSLATE_POOL = concurrent.futures.ThreadPoolExecutor(
+            max_workers=THREADS_PER_WORKER,
+            thread_name_prefix="translate"
+        )
+
+        # Start the micro-batching scheduler for /translate
+        translate_queue = asyncio.Queue()
+        asyncio.create_task(_batch_worker())
+        logger.info(f"🧵 Micro-batching worker started (max_batch={MAX_BATCH}, max_wait={MAX_WAIT_MS}ms)")
+
         logger.info("✅ Argos Translate Service ready!")
 
     except Exception as e:
@@ -109,11 +529,30 @@ class TranslateResponse(BaseModel):
     time_ms: float
 
 class BatchTranslateRequest(BaseModel):
-    """Batch translation request"""
+    """Batch translation request (fallback parser when msgspec is absent)"""
     texts: List[str] = Field(..., description="List of texts to translate", max_length=100)
     from_lang: str = Field(default="th", description="Source language code")
     to_lang: str = Field(default="en", description="Target language code")
 
+if MSGSPEC_AVAILABLE:
+    class BatchTranslatePayload(msgspec.Struct):
+        """msgspec mirror of BatchTranslateRequest — ~10x faster to decode"""
+        texts: List[str]
+        from_lang: str = "th"
+        to_lang: str = "en"
+
+    _batch_decoder = msgspec.json.Decoder(BatchTranslatePayload)
+
+
+def _parse_batch_body(body):
+    """Decode a /translate/batch body, bypassing Pydantic when msgspec is available"""
+    try:
+        if MSGSPEC_AVAILABLE:
+            return _batch_decoder.decode(body)
+        return BatchTranslateRequest.model_validate_json(body)
+    except Exception as e:
+        raise HTTPException(status_code=422, detail=f"Invalid request body: {str(e)}")
+
 class HealthResponse(BaseModel):
     """Health check response"""
     status: str
@@ -147,19 +586,20 @@ async def health_check():
     return {
         "status": "healthy" if th_en_translation else "unhealthy",
         "model_loaded": th_en_translation is not None,
-        "languages": [l.code for l in installed_languages] if installed_languages else [],
-        "stats": translation_stats
+        "languages": LANGUAGE_CODES,
+        "stats": _stats_snapshot()
     }
 
 @app.get("/stats", tags=["Stats"])
 async def get_stats():
     """Get translation statistics"""
     return {
-        "stats": translation_stats,
+        "stats": _stats_snapshot(),
         "model_info": {
             "source": "th",
             "target": "en",
-            "loaded": th_en_translation is not None
+            "loaded": th_en_translation is not None,
+            "backend": f"ctranslate2 ({ct2_backend})" if ct2_translator else "argos"
         }
     }
 
@@ -208,24 +648,17 @@ async def translate(request: TranslateRequest):
         start_time = time.time()
 
         # Perform translation
-        logger.info(f"📝 Translating: '{request.text[:50]}...'")
-        translated_text = th_en_translation.translate(request.text)
+        logger.debug(f"📝 Translating: '{request.text[:50]}...'")
+        translated_text = await _translate_text(request.text)
 
         # Calculate elapsed time
         elapsed_ms = (time.time() - start_time) * 1000
 
         # Update stats
-        translation_stats["total_requests"] += 1
-        translation_stats["total_characters"] += len(request.text)
-
-        # Update average time (running average)
-        prev_avg = translation_stats["average_time_ms"]
-        total_requests = translation_stats["total_requests"]
-        translation_stats["average_time_ms"] = (
-            (prev_avg * (total_requests - 1) + elapsed_ms) / total_requests
-        )
+        _record_stats(requests=1, characters=len(request.text), time_ms=elapsed_ms)
 
-        logger.info(f"✅ Translated in {elapsed_ms:.1f}ms: '{translated_text[:50]}...'")
+        # Per-request timing stays at DEBUG — /stats is the observability path
+        logger.debug(f"✅ Translated in {elapsed_ms:.1f}ms: '{translated_text[:50]}...'")
 
         return TranslateResponse(
             original=request.text,
@@ -238,7 +671,7 @@ async def translate(request: TranslateRequest):
         )
 
     except Exception as e:
-        translation_stats["errors"] += 1
+        _record_stats(errors=1)
         logger.error(f"❌ Translation error: {str(e)}")
         raise HTTPException(
             status_code=500,
@@ -246,7 +679,7 @@ async def translate(request: TranslateRequest):
         )
 
 @app.post("/translate/batch", tags=["Translation"])
-async def translate_batch(request: BatchTranslateRequest):
+async def translate_batch(request: Request):
     """
     Translate multiple texts at once
 
@@ -264,13 +697,17 @@ async def translate_batch(request: BatchTranslateRequest):
     **Returns:** List of translations in same order
     """
 
+    # Decode the body with msgspec instead of Pydantic — this endpoint is
+    # the high-throughput path, so serde overhead matters
+    payload = _parse_batch_body(await request.body())
+
     if not th_en_translation:
         raise HTTPException(
             status_code=503,
             detail="Translation model not loaded"
         )
 
-    if len(request.texts) > 100:
+    if len(payload.texts) > 100:
         raise HTTPException(
             status_code=400,
             detail="Batch size too large (max 100 texts)"
@@ -279,33 +716,35 @@ async def translate_batch(request: BatchTranslateRequest):
     try:
         start_time = time.time()
 
-        logger.info(f"📝 Batch translating {len(request.texts)} texts...")
+        logger.debug(f"📝 Batch translating {len(payload.texts)} texts...")
 
-        translated = []
-        for text in request.texts:
-            if text and text.strip():
-                result = th_en_translation.translate(text)
-                translated.append(result)
-                translation_stats["total_characters"] += len(text)
-            else:
-                translated.append("")
+        # Single batched decode — amortizes encoder/decoder matmuls over
+        # the whole request instead of N independent forward passes,
+        # offloaded so the event loop keeps serving other requests
+        translated = await asyncio.get_running_loop().run_in_executor(
+            TRANSLATE_POOL, _model_translate_batch, payload.texts
+        )
 
         elapsed_ms = (time.time() - start_time) * 1000
-        translation_stats["total_requests"] += len(request.texts)
+        _record_stats(
+            requests=len(payload.texts),
+            characters=sum(len(t) for t in payload.texts if t and t.strip()),
+            time_ms=elapsed_ms
+        )
 
-        logger.info(f"✅ Batch translated in {elapsed_ms:.1f}ms")
+        logger.debug(f"✅ Batch translated in {elapsed_ms:.1f}ms")
 
         return {
-            "count": len(request.texts),
-            "originals": request.texts,
+            "count": len(payload.texts),
+            "originals": payload.texts,
             "translated": translated,
             "success": True,
             "total_time_ms": round(elapsed_ms, 2),
-            "avg_time_per_text_ms": round(elapsed_ms / len(request.texts), 2)
+            "avg_time_per_text_ms": round(elapsed_ms / len(payload.texts), 2)
         }
 
     except Exception as e:
-        translation_stats["errors"] += len(request.texts)
+        _record_stats(errors=len(payload.texts))
         logger.error(f"❌ Batch translation error: {str(e)}")
         raise HTTPException(
             status_code=500,
@@ -315,13 +754,9 @@ async def translate_batch(request: BatchTranslateRequest):
 @app.post("/reset-stats", tags=["Stats"])
 async def reset_stats():
     """Reset translation statistics"""
-    global translation_stats
-    translation_stats = {
-        "total_requests": 0,
-        "total_characters": 0,
-        "average_time_ms": 0,
-        "errors": 0
-    }
+    for counter in translation_stats.values():
+        with counter.get_lock():
+            counter.value = 0
     logger.info("📊 Statistics reset")
     return {"message": "Statistics reset successfully"}
 